@@ -19,6 +19,23 @@ import sympy
 
 import cirq
 
+_CCX_PERMUTATION = [0, 1, 2, 3, 4, 5, 7, 6]
+_CSWAP_PERMUTATION = [0, 1, 2, 3, 4, 6, 5, 7]
+
+_CCX_UNITARY = np.eye(8, dtype=np.int8)[_CCX_PERMUTATION]
+
+_CCZ_UNITARY = np.eye(8, dtype=np.int8)
+_CCZ_UNITARY[7, 7] = -1
+
+_CSWAP_UNITARY = np.eye(8, dtype=np.int8)[_CSWAP_PERMUTATION]
+
+
+def _assert_unitary_is_integer_matrix(val, expected):
+    actual = cirq.unitary(val)
+    np.testing.assert_array_equal(np.round(actual.real).astype(np.int8),
+                                  expected)
+    assert np.abs(actual - expected).max() < 1e-8
+
 
 @pytest.mark.parametrize('eigen_gate_type', [
     cirq.CCXPowGate,
@@ -49,16 +66,7 @@ def test_init():
 
 def test_unitary():
     assert cirq.has_unitary(cirq.CCX)
-    np.testing.assert_allclose(cirq.unitary(cirq.CCX), np.array([
-        [1, 0, 0, 0, 0, 0, 0, 0],
-        [0, 1, 0, 0, 0, 0, 0, 0],
-        [0, 0, 1, 0, 0, 0, 0, 0],
-        [0, 0, 0, 1, 0, 0, 0, 0],
-        [0, 0, 0, 0, 1, 0, 0, 0],
-        [0, 0, 0, 0, 0, 1, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 1],
-        [0, 0, 0, 0, 0, 0, 1, 0],
-    ]), atol=1e-8)
+    _assert_unitary_is_integer_matrix(cirq.CCX, _CCX_UNITARY)
 
     assert cirq.has_unitary(cirq.CCX**0.5)
     np.testing.assert_allclose(cirq.unitary(cirq.CCX**0.5), np.array([
@@ -73,9 +81,7 @@ def test_unitary():
     ]), atol=1e-8)
 
     assert cirq.has_unitary(cirq.CCZ)
-    np.testing.assert_allclose(cirq.unitary(cirq.CCZ),
-                               np.diag([1, 1, 1, 1, 1, 1, 1, -1]),
-                               atol=1e-8)
+    _assert_unitary_is_integer_matrix(cirq.CCZ, _CCZ_UNITARY)
 
     assert cirq.has_unitary(cirq.CCZ**0.5)
     np.testing.assert_allclose(cirq.unitary(cirq.CCZ**0.5),
@@ -83,16 +89,7 @@ def test_unitary():
                                atol=1e-8)
 
     assert cirq.has_unitary(cirq.CSWAP)
-    np.testing.assert_allclose(cirq.unitary(cirq.CSWAP), np.array([
-        [1, 0, 0, 0, 0, 0, 0, 0],
-        [0, 1, 0, 0, 0, 0, 0, 0],
-        [0, 0, 1, 0, 0, 0, 0, 0],
-        [0, 0, 0, 1, 0, 0, 0, 0],
-        [0, 0, 0, 0, 1, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 1, 0],
-        [0, 0, 0, 0, 0, 1, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0, 1],
-    ]), atol=1e-8)
+    _assert_unitary_is_integer_matrix(cirq.CSWAP, _CSWAP_UNITARY)
 
     diagonal_angles = [2, 3, 5, 7, 11, 13, 17, 19]
     assert cirq.has_unitary(cirq.ThreeQubitDiagonalGate(diagonal_angles))
@@ -174,8 +171,11 @@ def test_identity_multiplication():
 def test_decomposition_cost(op: cirq.Operation, max_two_cost: int):
     ops = tuple(
         cirq.flatten_op_tree(cirq.google.ConvertToXmonGates().convert(op)))
-    two_cost = len([e for e in ops if len(e.qubits) == 2])
-    over_cost = len([e for e in ops if len(e.qubits) > 2])
+    two_cost = over_cost = 0
+    for e in ops:
+        n = len(e.qubits)
+        two_cost += n == 2
+        over_cost += n > 2
     assert over_cost == 0
     assert two_cost == max_two_cost
 
@@ -190,10 +190,11 @@ def test_decomposition_respects_locality(gate):
     a = cirq.GridQubit(0, 0)
     b = cirq.GridQubit(1, 0)
     c = cirq.GridQubit(0, 1)
+    converter = cirq.google.ConvertToXmonGates()
 
     for x, y, z in itertools.permutations([a, b, c]):
         circuit = cirq.Circuit(gate(x, y, z))
-        cirq.google.ConvertToXmonGates().optimize_circuit(circuit)
+        converter.optimize_circuit(circuit)
         cirq.google.Foxtail.validate_circuit(circuit)
 
 
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest import mock
+
 import pytest
 
 import numpy as np
+import sympy
 
 import cirq
 from cirq.testing.circuit_compare import (
@@ -47,6 +50,39 @@ def test_sensitive_to_phase():
         atol=0.01)
 
 
+def test_identical_circuits_are_equivalent():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(a), cirq.CNOT(a, b), cirq.measure(b))
+
+    cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(
+        circuit, circuit.copy(), atol=0)
+
+    # Identical unitary circuits never need their matrices.
+    with mock.patch.object(cirq.Circuit,
+                           'unitary',
+                           side_effect=AssertionError('unitary computed')):
+        cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(
+            circuit, circuit.copy(), atol=0)
+
+    # Identical circuits without a unitary are still rejected.
+    with pytest.raises(TypeError):
+        cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(
+            cirq.Circuit(cirq.X(a)**sympy.Symbol('t')),
+            cirq.Circuit(cirq.X(a)**sympy.Symbol('t')),
+            atol=1e-8)
+    with pytest.raises(TypeError):
+        cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(
+            cirq.Circuit(cirq.depolarize(0.1)(a)),
+            cirq.Circuit(cirq.depolarize(0.1)(a)),
+            atol=1e-8)
+
+    with pytest.raises(AssertionError):
+        cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(
+            cirq.Circuit(cirq.measure(a), cirq.H(a)),
+            cirq.Circuit(cirq.measure(a), cirq.H(a)),
+            atol=0)
+
+
 def test_sensitive_to_measurement_but_not_measured_phase():
     q = cirq.NamedQubit('q')
 
@@ -190,15 +226,10 @@ def test_measuring_qubits():
         atol=1e-8)
 
 
-@pytest.mark.parametrize(
-    'circuit',
-    [
-        cirq.testing.random_circuit(cirq.LineQubit.range(2), 4, 0.5)
-        for _ in range(5)
-    ]
-)
-def test_random_same_matrix(circuit):
+@pytest.mark.parametrize('seed', range(5))
+def test_random_same_matrix(seed):
     a, b = cirq.LineQubit.range(2)
+    circuit = cirq.testing.random_circuit([a, b], 4, 0.5, random_state=seed)
     same = cirq.Circuit(
         cirq.MatrixGate(
             circuit.unitary(qubits_that_should_be_present=[a, b])).on(a, b))